@@ -4,25 +4,56 @@ Monitoring script for the PolyRatings scraper.
 Checks data freshness, completeness, and provides health metrics.
 """
 
-import json
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
-
-def load_data() -> Optional[Dict]:
-    """Load the scraped data file."""
-    data_file = Path("data/professors.json")
-    if not data_file.exists():
-        print("❌ No data file found at data/professors.json")
-        return None
-    
-    try:
-        with open(data_file, 'r') as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
-        print(f"❌ Error reading data file: {e}")
-        return None
+from typing import Dict, Iterable, Iterator, Optional
+
+import ijson
+import numpy as np
+
+DATA_FILE = Path("data/professors.json")
+
+def _data_is_array(data_file: Path) -> bool:
+    """True when the data file is a bare top-level professors array."""
+    with open(data_file, 'rb') as f:
+        while True:
+            chunk = f.read(64)
+            if not chunk:
+                return False
+            stripped = chunk.lstrip()
+            if stripped:
+                return stripped[:1] == b'['
+
+def iter_professors(data_file: Path) -> Iterator[Dict]:
+    """
+    Yield professors one at a time without materializing the full list.
+
+    Handles both the bare array that save_professors_json writes and the
+    wrapped {"scraped_at": ..., "professors": [...]} layout.
+    """
+    prefix = 'item' if _data_is_array(data_file) else 'professors.item'
+    with open(data_file, 'rb') as f:
+        yield from ijson.items(f, prefix)
+
+def load_metadata(data_file: Path) -> Dict:
+    """
+    Parse just the top-level scalar fields (e.g. scraped_at) from the data
+    file. A bare array has no metadata, and for the wrapped layout the event
+    scan stops as soon as both fields have been seen, so this never streams
+    the professors themselves.
+    """
+    meta = {}
+    if _data_is_array(data_file):
+        return meta
+    wanted = ('scraped_at', 'total_professors')
+    with open(data_file, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if event in ('string', 'number') and prefix in wanted:
+                meta[prefix] = value
+                if len(meta) == len(wanted):
+                    break
+    return meta
 
 def check_data_freshness(data: Dict) -> bool:
     """Check if the data is fresh (less than 24 hours old)."""
@@ -47,10 +78,10 @@ def check_data_freshness(data: Dict) -> bool:
         print(f"❌ Error parsing timestamp: {e}")
         return False
 
-def check_data_completeness(data: Dict) -> Dict:
-    """Check the completeness of the scraped data."""
+def check_data_completeness(professors: Iterable[Dict]) -> Dict:
+    """Fold completeness stats in a single pass over a professor iterable."""
     stats = {
-        'total_professors': data.get('total_professors', 0),
+        'total_professors': 0,
         'professors_with_ratings': 0,
         'professors_with_reviews': 0,
         'professors_with_departments': 0,
@@ -58,101 +89,118 @@ def check_data_completeness(data: Dict) -> Dict:
         'avg_rating': 0.0,
         'rating_distribution': {}
     }
-    
-    professors = data.get('professors', [])
+
+    # One streaming pass keeps only the ratings list resident, not every
+    # professor dict; the numeric reductions then run vectorized in NumPy.
+    ratings = []
     departments = set()
-    total_rating = 0.0
-    rating_count = 0
-    
     for prof in professors:
-        # Count professors with ratings
+        stats['total_professors'] += 1
         if prof.get('rating') is not None:
-            stats['professors_with_ratings'] += 1
-            total_rating += prof['rating']
-            rating_count += 1
-            
-            # Track rating distribution
-            rating_floor = int(prof['rating'])
-            stats['rating_distribution'][rating_floor] = stats['rating_distribution'].get(rating_floor, 0) + 1
-        
-        # Count professors with review counts
+            ratings.append(prof['rating'])
         if prof.get('review_count') is not None and prof['review_count'] > 0:
             stats['professors_with_reviews'] += 1
-        
-        # Count professors with departments
-        if prof.get('department') and prof['department'].strip():
+        department = prof.get('department')
+        if department and department.strip():
             stats['professors_with_departments'] += 1
-            departments.add(prof['department'])
-    
+            departments.add(department)
+
     stats['departments_count'] = len(departments)
-    stats['avg_rating'] = total_rating / rating_count if rating_count > 0 else 0.0
-    
+    ratings = np.asarray(ratings, dtype=np.float64)
+    stats['professors_with_ratings'] = int(ratings.size)
+    stats['avg_rating'] = float(ratings.mean()) if ratings.size else 0.0
+    if ratings.size:
+        buckets = np.bincount(ratings.astype(np.int64), minlength=5)
+        stats['rating_distribution'] = {
+            rating: int(count) for rating, count in enumerate(buckets) if count
+        }
+
     return stats
 
+# Prebuilt visual bars for the rating distribution (one per 5% step).
+_BARS = ["█" * i for i in range(21)]
+
 def print_health_report(data: Dict, stats: Dict):
     """Print a comprehensive health report."""
-    print("\n" + "="*50)
-    print("🏥 POLYRATINGS SCRAPER HEALTH REPORT")
-    print("="*50)
-    
+    # Collect every row and write once, instead of paying a print() call
+    # (stdout lock + encode) per line.
+    lines = []
+    lines.append("\n" + "="*50)
+    lines.append("🏥 POLYRATINGS SCRAPER HEALTH REPORT")
+    lines.append("="*50)
+
     # Basic info
-    print(f"📊 Total Professors: {stats['total_professors']}")
-    print(f"📅 Last Scraped: {data.get('scraped_at', 'Unknown')}")
-    
+    lines.append(f"📊 Total Professors: {stats['total_professors']}")
+    lines.append(f"📅 Last Scraped: {data.get('scraped_at', 'Unknown')}")
+
+    # Nothing to break down (and nothing to divide by) without professors
+    if stats['total_professors'] == 0:
+        lines.append("\n⚠️  No professors found in data file")
+        print("\n".join(lines))
+        return
+
     # Completeness metrics
-    print(f"\n📈 Completeness Metrics:")
-    print(f"   • Professors with ratings: {stats['professors_with_ratings']} ({stats['professors_with_ratings']/stats['total_professors']*100:.1f}%)")
-    print(f"   • Professors with reviews: {stats['professors_with_reviews']} ({stats['professors_with_reviews']/stats['total_professors']*100:.1f}%)")
-    print(f"   • Professors with departments: {stats['professors_with_departments']} ({stats['professors_with_departments']/stats['total_professors']*100:.1f}%)")
-    print(f"   • Unique departments: {stats['departments_count']}")
-    
+    lines.append(f"\n📈 Completeness Metrics:")
+    lines.append(f"   • Professors with ratings: {stats['professors_with_ratings']} ({stats['professors_with_ratings']/stats['total_professors']*100:.1f}%)")
+    lines.append(f"   • Professors with reviews: {stats['professors_with_reviews']} ({stats['professors_with_reviews']/stats['total_professors']*100:.1f}%)")
+    lines.append(f"   • Professors with departments: {stats['professors_with_departments']} ({stats['professors_with_departments']/stats['total_professors']*100:.1f}%)")
+    lines.append(f"   • Unique departments: {stats['departments_count']}")
+
     # Rating statistics
-    print(f"\n⭐ Rating Statistics:")
-    print(f"   • Average rating: {stats['avg_rating']:.2f}")
-    print(f"   • Rating distribution:")
+    lines.append(f"\n⭐ Rating Statistics:")
+    lines.append(f"   • Average rating: {stats['avg_rating']:.2f}")
+    lines.append(f"   • Rating distribution:")
     for rating in sorted(stats['rating_distribution'].keys()):
         count = stats['rating_distribution'][rating]
         percentage = count / stats['professors_with_ratings'] * 100
-        bars = "█" * int(percentage / 5)  # Visual bar
-        print(f"     {rating}⭐: {count:4d} ({percentage:5.1f}%) {bars}")
-    
+        bars = _BARS[int(percentage / 5)]  # Visual bar
+        lines.append(f"     {rating}⭐: {count:4d} ({percentage:5.1f}%) {bars}")
+
     # Health assessment
-    print(f"\n🔍 Health Assessment:")
+    lines.append(f"\n🔍 Health Assessment:")
     if stats['total_professors'] < 1000:
-        print("   ⚠️  Low professor count - scraper may not be working properly")
+        lines.append("   ⚠️  Low professor count - scraper may not be working properly")
     elif stats['total_professors'] < 2000:
-        print("   ⚠️  Moderate professor count - some data may be missing")
+        lines.append("   ⚠️  Moderate professor count - some data may be missing")
     else:
-        print("   ✅ Good professor count")
-    
+        lines.append("   ✅ Good professor count")
+
     if stats['professors_with_ratings'] / stats['total_professors'] < 0.8:
-        print("   ⚠️  Many professors missing ratings")
+        lines.append("   ⚠️  Many professors missing ratings")
     else:
-        print("   ✅ Good rating coverage")
-    
+        lines.append("   ✅ Good rating coverage")
+
     if stats['professors_with_departments'] / stats['total_professors'] < 0.8:
-        print("   ⚠️  Many professors missing department info")
+        lines.append("   ⚠️  Many professors missing department info")
     else:
-        print("   ✅ Good department coverage")
+        lines.append("   ✅ Good department coverage")
+
+    print("\n".join(lines))
 
 def main():
     """Main monitoring function."""
     print("🔍 PolyRatings Scraper Monitor")
     print("="*40)
     
-    # Load data
-    data = load_data()
-    if not data:
+    if not DATA_FILE.exists():
+        print(f"❌ No data file found at {DATA_FILE}")
         return 1
-    
-    # Check freshness
-    is_fresh = check_data_freshness(data)
-    
-    # Check completeness
-    stats = check_data_completeness(data)
-    
+
+    # A truncated or unreadable file (e.g. a crashed scrape mid-write) is a
+    # condition to report on, not to crash on.
+    try:
+        # Check freshness (small metadata-only parse)
+        meta = load_metadata(DATA_FILE)
+        is_fresh = check_data_freshness(meta)
+
+        # Check completeness in a single streaming pass
+        stats = check_data_completeness(iter_professors(DATA_FILE))
+    except (ijson.JSONError, OSError) as e:
+        print(f"❌ Error reading data file: {e}")
+        return 1
+
     # Print health report
-    print_health_report(data, stats)
+    print_health_report(meta, stats)
     
     # Overall status
     print(f"\n🎯 Overall Status:")
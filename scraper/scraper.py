@@ -1,5 +1,6 @@
 import time
 import json
+import logging
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
@@ -8,119 +9,176 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, WebDriverException, TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from config import ScraperConfig
 from validators import create_professor_entry, save_professors_json
 from utils import setup_logging, safe_request_delay
 
-logger = setup_logging()
+# Handlers are configured in main(); importing this module has no logging
+# side effects (no scraper.log opened for tests or tooling).
+logger = logging.getLogger(__name__)
+
+# Compiled XPath expressions for the professor card markup; compiling once at
+# import time keeps the per-card selection entirely in lxml's C code.
+_CARDS_XPATH = etree.XPath("//div[contains(@class,'absolute')]/a[starts-with(@href,'/professor/')]")
+_NAME_XPATH = etree.XPath(".//h3[contains(@class,'text-3xl')]")
+_RATING_XPATH = etree.XPath(".//div[contains(@class,'items-center') and contains(@class,'justify-end')]/div[last()]")
 
 def extract_professors_from_dom(driver):
     """
     Parse the current DOM and extract all professor cards.
     Returns a list of (name, rating, link) tuples.
     """
-    soup = BeautifulSoup(driver.page_source, "lxml")
-    cards = soup.select('div.absolute > a')
+    # Hand lxml UTF-8 bytes directly so it doesn't re-encode the multi-MB
+    # source string internally; this only runs on the final safety-net pass.
+    doc = lxml.html.fromstring(driver.page_source.encode('utf-8', 'replace'))
     professors = []
-    for a_tag in cards:
+    for a_tag in _CARDS_XPATH(doc):
         try:
             # Profile link
-            href = a_tag.get('href')
-            if not href or not href.startswith('/professor/'):
-                continue
-            link = ScraperConfig.BASE_URL + href
+            link = ScraperConfig.BASE_URL + a_tag.get('href')
             # Name
-            h3 = a_tag.select_one('h3.text-3xl')
-            name = h3.get_text(strip=True) if h3 else None
+            h3 = _NAME_XPATH(a_tag)
+            name = h3[0].text_content().strip() if h3 else None
             # Rating
-            rating_div = a_tag.select_one('div.flex.items-center.justify-end > div:last-child')
-            rating = rating_div.get_text(strip=True) if rating_div else None
+            rating_div = _RATING_XPATH(a_tag)
+            rating = rating_div[0].text_content().strip() if rating_div else None
             professors.append((name, rating, link))
         except Exception as e:
             logger.warning(f"Failed to parse a professor card: {e}")
     return professors
 
-def fine_grained_scroll_and_collect(driver, scroll_pause=0.15, increment=100, max_no_new=50):
+# JS expression that extracts the currently rendered professor cards in the
+# browser, returning only [name, rating, href] triples instead of the full
+# page HTML. The rating is parseFloat-ed browser-side so Python receives a
+# ready number and the regex-based rating extraction is skipped entirely.
+EXTRACT_CARDS_JS = (
+    "Array.from(document.querySelectorAll("
+    "'div.absolute > a[href^=\"/professor/\"]')).map(a => { "
+    "const r = parseFloat(a.querySelector('div.flex.items-center.justify-end > div:last-child')?.innerText); "
+    "return [a.querySelector('h3.text-3xl')?.innerText, "
+    "Number.isNaN(r) ? null : r, "
+    "a.getAttribute('href')]; })"
+)
+
+# One fused step per scroll increment: scroll, report the current scroll
+# height, and extract the visible cards in a single CDP roundtrip.
+INSTALL_STEP_JS = (
+    "window.__step = (y) => { window.scrollTo(0, y); "
+    "return [document.body.scrollHeight, " + EXTRACT_CARDS_JS + "]; };"
+)
+
+def fine_grained_scroll_and_collect(driver, scroll_pause=0.15, increment=None, max_no_new=10, max_height_stable=5,
+                                    entry_factory=create_professor_entry):
     """
-    Scroll through the page in small increments, extracting visible professors at each step.
-    This ensures every professor is rendered at least once.
+    Scroll through the page in viewport-sized increments, extracting visible
+    professors at each step. The list virtualizes rows in viewport-sized
+    chunks, so every professor is still rendered at least once. Stops once
+    the scroll height has plateaued and no new professors are arriving.
+
+    Each card is validated through entry_factory the first time its link is
+    seen, so dedup, validation, and entry construction happen in one pass.
+    Returns a dict mapping profile link to the validated entry (or None for
+    cards that failed validation).
     """
-    all_professors = set()
+    # Keyed by profile link so deduplication happens inline; hashing one
+    # string per card is cheaper than hashing the full 3-tuple, and no
+    # second dedup pass is needed afterwards.
+    all_professors = {}
     last_count = 0
     no_new_count = 0
+    height_stable_count = 0
     scroll_position = 0
+    driver.execute_script(INSTALL_STEP_JS)
+    if increment is None:
+        # 80% of the viewport keeps consecutive steps overlapping while
+        # taking far fewer iterations than a fixed 100px stride.
+        increment = driver.execute_script("return Math.round(window.innerHeight * 0.8)")
     total_height = driver.execute_script("return document.body.scrollHeight")
-    logger.info(f"Total scrollable height: {total_height}")
-    
+    prev_height = total_height
+    logger.info(f"Total scrollable height: {total_height}, increment: {increment}")
+
     while scroll_position < total_height:
-        driver.execute_script(f"window.scrollTo(0, {scroll_position});")
+        # Scroll, re-read the height, and extract visible cards in one call.
+        total_height, cards = driver.execute_script(
+            "return window.__step(arguments[0]);", scroll_position
+        )
         time.sleep(scroll_pause)
-        current_professors = extract_professors_from_dom(driver)
-        for prof in current_professors:
-            all_professors.add(prof)
+        for name, rating, href in cards:
+            if href:
+                link = ScraperConfig.BASE_URL + href
+                if link not in all_professors:
+                    all_professors[link] = entry_factory(name, rating, link)
+        if total_height == prev_height:
+            height_stable_count += 1
+        else:
+            height_stable_count = 0
+            prev_height = total_height
         if len(all_professors) == last_count:
             no_new_count += 1
         else:
             no_new_count = 0
             last_count = len(all_professors)
-        if no_new_count >= max_no_new:
-            logger.info(f"Stopping: No new professors found for {no_new_count} increments.")
+        if height_stable_count >= max_height_stable and no_new_count >= max_no_new:
+            logger.info(f"Stopping: height stable for {height_stable_count} steps, no new professors for {no_new_count} steps.")
             break
-        if scroll_position % 1000 == 0:
-            logger.info(f"Scrolled to {scroll_position}, total unique professors: {len(all_professors)}")
+        logger.info(f"Scrolled to {scroll_position}, total unique professors: {len(all_professors)}")
         scroll_position += increment
-        # Update total_height in case it grows
-        total_height = driver.execute_script("return document.body.scrollHeight")
-    # Final pass at the bottom
+    # Final pass at the bottom; full DOM parse as a safety net for anything
+    # the incremental JS extraction missed. Links whose first sighting failed
+    # validation are cached as None, so retry those too rather than treating
+    # them as already handled.
     driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
     time.sleep(scroll_pause * 2)
     current_professors = extract_professors_from_dom(driver)
-    for prof in current_professors:
-        all_professors.add(prof)
+    for name, rating, link in current_professors:
+        if all_professors.get(link) is None:
+            all_professors[link] = entry_factory(name, rating, link)
     logger.info(f"Fine-grained scroll finished. Collected {len(all_professors)} unique professors.")
-    return list(all_professors)
-
-def deduplicate_professors(professors):
-    seen = set()
-    unique = []
-    for name, rating, link in professors:
-        if link not in seen:
-            seen.add(link)
-            unique.append((name, rating, link))
-    return unique
+    return all_professors
 
 def main():
+    setup_logging()
     logger.info("Starting PolyRatings scraper...")
     options = Options()
     options.add_argument('--headless')
     options.add_argument('--disable-gpu')
     options.add_argument(f'user-agent={ScraperConfig.USER_AGENT}')
     options.add_argument('--window-size=1920,1080')
+    # The list page only needs JS and layout; skipping images and other
+    # content cuts most of the network bytes and shrinks the DOM we scroll.
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 1,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    # Trim browser startup overhead
+    options.add_argument('--disable-extensions')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--no-sandbox')
     driver = webdriver.Chrome(options=options)
     driver.set_page_load_timeout(ScraperConfig.REQUEST_TIMEOUT)
     driver.get(ScraperConfig.SEARCH_URL)
     logger.info(f"Loaded {ScraperConfig.SEARCH_URL}")
     time.sleep(5)
 
-    professors_raw = fine_grained_scroll_and_collect(driver, scroll_pause=0.15, increment=100, max_no_new=100)
-    logger.info(f"Extracted {len(professors_raw)} raw professor cards from DOM.")
+    collected = fine_grained_scroll_and_collect(driver, scroll_pause=0.15)
+    logger.info(f"Extracted {len(collected)} unique professor cards from DOM.")
     driver.quit()
 
-    professors_raw = deduplicate_professors(professors_raw)
-    logger.info(f"Deduplicated to {len(professors_raw)} unique professor cards.")
-
-    professors = []
-    for name, rating, link in professors_raw:
-        entry = create_professor_entry(name, rating, link)
-        if entry:
-            professors.append(entry)
-        else:
-            logger.warning(f"Invalid entry skipped: {name}, {rating}, {link}")
+    # Entries were validated as they were first collected; invalid cards are
+    # stored as None, so one filter pass replaces the old validation loop.
+    professors = [entry for entry in collected.values() if entry]
+    invalid = len(collected) - len(professors)
+    if invalid:
+        logger.warning(f"Skipped {invalid} invalid entries.")
 
     logger.info(f"Validated {len(professors)} professor entries.")
 
-    if save_professors_json(professors, ScraperConfig.OUTPUT_PATH):
+    # Entries were already validated when first collected
+    if save_professors_json(professors, ScraperConfig.OUTPUT_PATH, trusted=True):
         logger.info(f"Saved {len(professors)} professors to {ScraperConfig.OUTPUT_PATH}")
     else:
         logger.error("Failed to save professors.json")
@@ -11,12 +11,13 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+import pygit2
+
 def run_command(command, cwd=None):
-    """Run a shell command and return the result."""
+    """Run a command (list of arguments, no shell) and return its output."""
     try:
         result = subprocess.run(
             command,
-            shell=True,
             cwd=cwd,
             capture_output=True,
             text=True,
@@ -24,76 +25,79 @@ def run_command(command, cwd=None):
         )
         return result.stdout.strip()
     except subprocess.CalledProcessError as e:
-        print(f"Error running command '{command}': {e}")
+        print(f"Error running command '{' '.join(command)}': {e}")
         print(f"STDOUT: {e.stdout}")
         print(f"STDERR: {e.stderr}")
         return None
 
-def check_git_status():
+def check_git_status(repo):
     """Check if there are any uncommitted changes."""
-    status = run_command("git status --porcelain")
-    return bool(status)
+    return bool(repo.status())
 
-def commit_changes():
-    """Commit any changes to the data directory."""
+def commit_changes(repo):
+    """Commit any changes to the data directory in-process via pygit2."""
     # Check if there are changes in the data directory
-    data_status = run_command("git status --porcelain scraper/data/")
+    data_status = [path for path in repo.status() if path.startswith("scraper/data/")]
     if not data_status:
         print("No changes in data directory to commit.")
         return False
-    
-    # Add and commit changes
+
+    # Stage and commit without spawning git subprocesses
     print("Changes detected in data directory. Committing...")
-    
-    # Add the data directory
-    run_command("git add scraper/data/")
-    
+
+    index = repo.index
+    index.add_all(["scraper/data/"])
+    index.write()
+    tree = index.write_tree()
+
     # Create commit message with timestamp
     timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
     commit_msg = f"🤖 Automated scraper update - {timestamp}"
-    
-    # Commit
-    result = run_command(f'git commit -m "{commit_msg}"')
-    if result:
+
+    try:
+        signature = repo.default_signature
+        repo.create_commit("HEAD", signature, signature, commit_msg, tree, [repo.head.target])
         print(f"Successfully committed: {commit_msg}")
         return True
-    else:
-        print("Failed to commit changes.")
+    except (pygit2.GitError, KeyError) as e:
+        # default_signature raises KeyError when user.name/user.email are
+        # unset (the normal state on a fresh CI runner).
+        print(f"Failed to commit changes: {e}")
         return False
 
 def main():
     """Main workflow simulation."""
     print("🚀 Starting GitHub Actions workflow simulation...")
-    
+
     # Change to scraper directory
     scraper_dir = Path(__file__).parent
     os.chdir(scraper_dir)
-    
+
     # Step 1: Install dependencies
     print("\n📦 Installing dependencies...")
-    result = run_command("pip install -r requirements.txt")
+    result = run_command(["pip", "install", "-r", "requirements.txt"])
     if not result:
         print("Failed to install dependencies.")
         return 1
-    
+
     # Step 2: Run scraper
     print("\n🕷️ Running scraper...")
-    result = run_command("python scraper.py")
+    result = run_command([sys.executable, "scraper.py"])
     if not result:
         print("Failed to run scraper.")
         return 1
-    
+
     # Step 3: Check for changes
     print("\n🔍 Checking for changes...")
-    os.chdir("..")  # Go back to repository root
-    has_changes = check_git_status()
-    
+    repo = pygit2.Repository(str(scraper_dir.parent))
+    has_changes = check_git_status(repo)
+
     if has_changes:
         print("Changes detected!")
-        
+
         # Step 4: Commit changes
         print("\n💾 Committing changes...")
-        success = commit_changes()
+        success = commit_changes(repo)
         if success:
             print("\n✅ Workflow completed successfully!")
             return 0
@@ -105,4 +109,4 @@ def main():
         return 0
 
 if __name__ == "__main__":
-    sys.exit(main()) 
+    sys.exit(main())
@@ -5,6 +5,7 @@ Tests for the validators module.
 import unittest
 from validators import (
     validate_professor_data,
+    validate_professors_bulk,
     clean_professor_name,
     validate_rating,
     validate_professor_link,
@@ -102,5 +103,23 @@ class TestValidators(unittest.TestCase):
             with self.subTest(invalid_professor=invalid_professor):
                 self.assertFalse(validate_professor_data(invalid_professor))
 
+    def test_validate_professors_bulk(self):
+        """Test bulk professor validation."""
+        valid_professor = {
+            "name": "Smith, John",
+            "rating": 3.5,
+            "link": "https://polyratings.dev/professor/12345678-1234-1234-1234-123456789abc"
+        }
+        bad_rating = dict(valid_professor, rating=5.0)
+        bad_link = dict(valid_professor, link="invalid-link")
+
+        self.assertEqual(validate_professors_bulk([]), [])
+        self.assertEqual(
+            validate_professors_bulk([valid_professor, bad_rating, bad_link]),
+            [True, False, False]
+        )
+        # Non-dict rows are rejected, not raised on
+        self.assertEqual(validate_professors_bulk([None, valid_professor]), [False, True])
+
 if __name__ == "__main__":
-    unittest.main() 
+    unittest.main()
@@ -2,17 +2,42 @@
 Utility functions for the PolyRatings scraper.
 """
 
+import functools
+import html
 import time
 import logging
+import logging.handlers
 import re
 from typing import Optional, List, Dict, Any
 from urllib.parse import urljoin, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
 from config import ScraperConfig
 
+# Shared session so every HTTP request reuses pooled keep-alive connections
+# instead of paying a fresh TCP/TLS handshake per call.
+_SESSION = requests.Session()
+_SESSION.headers.update(ScraperConfig.HEADERS)
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=ScraperConfig.MAX_RETRIES, backoff_factor=0.3)
+))
+
+# Patterns compiled once at import time; these run once per professor in the
+# main validation loop, so skipping re's per-call cache lookup adds up.
+_UUID_IN_URL_RE = re.compile(r'/professor/([a-f0-9-]{36})$')
+_NUMBER_RE = re.compile(r'(\d+\.?\d*)')
+_UUID_RE = re.compile(r'^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
 def setup_logging() -> logging.Logger:
     """
     Set up logging configuration.
-    
+
     Returns:
         logging.Logger: Configured logger
     """
@@ -21,11 +46,25 @@ def setup_logging() -> logging.Logger:
         format=ScraperConfig.LOG_FORMAT,
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler('scraper.log')
+            # delay=True defers opening scraper.log until the first write,
+            # so short-lived runs (e.g. tests) never touch the file; the
+            # rotation bounds how large it can grow.
+            logging.handlers.RotatingFileHandler(
+                'scraper.log', maxBytes=10_000_000, backupCount=3, delay=True
+            )
         ]
     )
     return logging.getLogger(__name__)
 
+def get_session() -> requests.Session:
+    """
+    Get the shared HTTP session with connection pooling and retries.
+
+    Returns:
+        requests.Session: Configured session
+    """
+    return _SESSION
+
 def safe_request_delay():
     """Add a delay between requests to be respectful to the server."""
     time.sleep(ScraperConfig.REQUEST_DELAY)
@@ -44,9 +83,8 @@ def extract_professor_id_from_url(url: str) -> Optional[str]:
         return None
     
     # Pattern to match UUID in professor URL
-    pattern = r'/professor/([a-f0-9-]{36})$'
-    match = re.search(pattern, url)
-    
+    match = _UUID_IN_URL_RE.search(url)
+
     if match:
         return match.group(1)
     else:
@@ -76,19 +114,23 @@ def extract_rating_from_text(rating_text: str) -> Optional[float]:
     """
     if not rating_text:
         return None
-    
-    # Extract number from text (handles cases like "3.67" or "0.64")
-    pattern = r'(\d+\.?\d*)'
-    match = re.search(pattern, rating_text.strip())
-    
-    if match:
-        try:
-            rating = float(match.group(1))
-            if ScraperConfig.MIN_RATING <= rating <= ScraperConfig.MAX_RATING:
-                return round(rating, 2)
-        except ValueError:
-            pass
-    
+
+    text = rating_text.strip()
+
+    # Fast path: most ratings are already plain numbers like "3.67", and
+    # float() parses those in C without touching the regex engine.
+    try:
+        rating = float(text)
+    except ValueError:
+        # Fall back to extracting the first number from mixed text
+        match = _NUMBER_RE.search(text)
+        if not match:
+            return None
+        rating = float(match.group(1))
+
+    if ScraperConfig.MIN_RATING <= rating <= ScraperConfig.MAX_RATING:
+        return round(rating, 2)
+
     return None
 
 def clean_html_text(text: str) -> str:
@@ -105,32 +147,27 @@ def clean_html_text(text: str) -> str:
         return ""
     
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    
+    text = _HTML_TAG_RE.sub('', text)
+
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
-    
-    # Decode HTML entities
-    text = text.replace('&amp;', '&')
-    text = text.replace('&lt;', '<')
-    text = text.replace('&gt;', '>')
-    text = text.replace('&quot;', '"')
-    text = text.replace('&#39;', "'")
-    
-    return text
+    text = _WS_RE.sub(' ', text.strip())
 
+    # Decode HTML entities in a single pass
+    return html.unescape(text)
+
+@functools.lru_cache(maxsize=8192)
 def is_valid_uuid(uuid_string: str) -> bool:
     """
-    Check if a string is a valid UUID.
-    
+    Check if a string is a valid UUID. Results are memoized since the same
+    IDs recur across partial re-scrapes.
+
     Args:
         uuid_string: String to validate
-        
+
     Returns:
         bool: True if valid UUID, False otherwise
     """
-    pattern = r'^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$'
-    return bool(re.match(pattern, uuid_string.lower()))
+    return bool(_UUID_RE.match(uuid_string.lower()))
 
 def retry_on_failure(func, max_retries: int = None, delay: float = 1.0):
     """
@@ -2,31 +2,79 @@
 Data validation functions for the PolyRatings scraper.
 """
 
+import functools
 import json
+import logging
 import re
+import string
 from typing import Dict, List, Any, Optional
-from jsonschema import validate, ValidationError
+import fastjsonschema
+import ijson
+import numpy as np
 from config import ScraperConfig
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Rejection paths log at DEBUG with deferred %-formatting, so production
+# runs skip both the string build and the stdout lock on every reject.
+log = logging.getLogger(__name__)
+
+# Config bounds bound to module level once; the validators run per
+# professor and a plain global load beats the class-attribute chain.
+_MIN_RATING = ScraperConfig.MIN_RATING
+_MAX_RATING = ScraperConfig.MAX_RATING
+_MIN_NAME_LENGTH = ScraperConfig.MIN_NAME_LENGTH
+_MAX_NAME_LENGTH = ScraperConfig.MAX_NAME_LENGTH
+
+# Patterns compiled once at import time; these run once per professor, so
+# skipping re's per-call cache lookup adds up over a full scrape.
+_WS_RE = re.compile(r'\s+')
+_NAME_STRIP_RE = re.compile(r"[^A-Za-z\s,.'-]")
+
+# Single source of truth for the professor-link and name patterns: the
+# schema below references the source text and the validators use the
+# compiled form, so each pattern exists (and is compiled) exactly once
+# per process.
+_LINK_PATTERN_SRC = r'^https://polyratings\.dev/professor/[a-f0-9-]+$'
+_LINK_RE = re.compile(_LINK_PATTERN_SRC)
+_NAME_PATTERN_SRC = r"^[A-Za-z\s,\.'-]+$"
+_NAME_RE = re.compile(_NAME_PATTERN_SRC)
+
+# Hand-rolled equivalent of _LINK_RE for the hot path: an anchored prefix
+# check plus a hex/dash scan runs entirely in CPython's C string code.
+_LINK_PREFIX = 'https://polyratings.dev/professor/'
+_LINK_TAIL_CHARS = frozenset('0123456789abcdef-')
+
+# Deletion table for the ASCII fast path of clean_professor_name: dropping
+# disallowed characters via str.translate is a straight C loop, with the
+# regex kept only for names containing non-ASCII codepoints.
+_ALLOWED_NAME_CHARS = set(string.ascii_letters + " ,.'-")
+_NAME_DELETE_TBL = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(128) if chr(c) not in _ALLOWED_NAME_CHARS)
+)
+
 # JSON schema for professor data
 PROFESSOR_SCHEMA = {
     "type": "object",
     "properties": {
         "name": {
             "type": "string",
-            "minLength": ScraperConfig.MIN_NAME_LENGTH,
-            "maxLength": ScraperConfig.MAX_NAME_LENGTH,
-            "pattern": r"^[A-Za-z\s,\.'-]+$"
+            "minLength": _MIN_NAME_LENGTH,
+            "maxLength": _MAX_NAME_LENGTH,
+            "pattern": _NAME_PATTERN_SRC
         },
         "rating": {
             "type": "number",
-            "minimum": ScraperConfig.MIN_RATING,
-            "maximum": ScraperConfig.MAX_RATING
+            "minimum": _MIN_RATING,
+            "maximum": _MAX_RATING
         },
         "link": {
             "type": "string",
             "format": "uri",
-            "pattern": r"^https://polyratings\.dev/professor/[a-f0-9-]+$"
+            "pattern": _LINK_PATTERN_SRC
         }
     },
     "required": ["name", "rating", "link"],
@@ -39,6 +87,51 @@ PROFESSORS_LIST_SCHEMA = {
     "minItems": 1
 }
 
+@functools.lru_cache(maxsize=None)
+def _compiled_validator_for(schema_json: str):
+    """Compile and cache a validator keyed by canonical schema JSON."""
+    return fastjsonschema.compile(json.loads(schema_json))
+
+def validator_for(schema: Dict[str, Any]):
+    """
+    Return the compiled validation function for a schema dict.
+
+    Keying the cache on the schema's sorted-key JSON means semantically
+    identical schemas share one compiled function, so schemas built
+    dynamically (e.g. per-department variants) stay cheap to compile.
+
+    Args:
+        schema: JSON schema dictionary
+
+    Returns:
+        Compiled validation function for the schema
+    """
+    return _compiled_validator_for(json.dumps(schema, sort_keys=True))
+
+# Validation function code-generated once at import time; the schema is
+# fixed, so fastjsonschema compiles it into a straight-line specialized
+# function instead of interpreting the schema tree per instance.
+_validate_prof = validator_for(PROFESSOR_SCHEMA)
+
+def _fast_valid(professor) -> bool:
+    """
+    Hand-rolled check specialized to PROFESSOR_SCHEMA's fixed shape: three
+    required keys, no extras, string/number/string with one regex and a
+    numeric range. Inlines exactly those checks with no keyword dispatch.
+    """
+    if type(professor) is not dict or len(professor) != 3:
+        return False
+    name = professor.get('name')
+    rating = professor.get('rating')
+    link = professor.get('link')
+    if type(name) is not str or not (_MIN_NAME_LENGTH <= len(name) <= _MAX_NAME_LENGTH):
+        return False
+    if type(rating) not in (int, float) or not (_MIN_RATING <= rating <= _MAX_RATING):
+        return False
+    if type(link) is not str or not _LINK_RE.match(link):
+        return False
+    return _NAME_RE.match(name) is not None
+
 def validate_professor_data(professor: Dict[str, Any]) -> bool:
     """
     Validate a single professor data entry.
@@ -49,11 +142,15 @@ def validate_professor_data(professor: Dict[str, Any]) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
+    if _fast_valid(professor):
+        return True
+    # Cold path: rerun the compiled schema purely for the error message
     try:
-        validate(instance=professor, schema=PROFESSOR_SCHEMA)
+        _validate_prof(professor)
         return True
-    except ValidationError as e:
-        print(f"Validation error for professor {professor.get('name', 'Unknown')}: {e.message}")
+    except fastjsonschema.JsonSchemaValueException as e:
+        name = professor.get('name', 'Unknown') if isinstance(professor, dict) else 'Unknown'
+        log.debug("Validation error for professor %s: %s", name, e.message)
         return False
 
 def validate_professors_list(professors: List[Dict[str, Any]]) -> bool:
@@ -66,20 +163,56 @@ def validate_professors_list(professors: List[Dict[str, Any]]) -> bool:
     Returns:
         bool: True if all entries are valid, False otherwise
     """
-    try:
-        validate(instance=professors, schema=PROFESSORS_LIST_SCHEMA)
-        return True
-    except ValidationError as e:
-        print(f"Validation error for professors list: {e.message}")
+    # Reuse the compiled per-item validator and stop at the first failure
+    # instead of walking the whole array through a list-level schema.
+    if not professors:
+        log.debug("Validation error for professors list: list is empty")
         return False
+    return all(validate_professor_data(professor) for professor in professors)
+
+def validate_professors_bulk(professors: List[Dict[str, Any]]) -> List[bool]:
+    """
+    Validate a batch of professor entries, returning per-row validity.
+
+    The numeric rating bounds are checked for all rows in one vectorized
+    NumPy pass and the link regex runs per row in C; only rows that pass
+    these cheap filters fall through to the full schema validator.
+
+    Args:
+        professors: List of professor dictionaries
 
+    Returns:
+        List[bool]: Validity flag per input row
+    """
+    if not professors:
+        return []
+
+    ratings = np.fromiter(
+        (p['rating'] if isinstance(p, dict) and isinstance(p.get('rating'), (int, float)) else np.nan
+         for p in professors),
+        dtype=np.float64,
+        count=len(professors)
+    )
+    rating_ok = (ratings >= _MIN_RATING) & (ratings <= _MAX_RATING)
+    link_ok = [
+        isinstance(p, dict) and isinstance(p.get('link'), str) and _LINK_RE.match(p['link']) is not None
+        for p in professors
+    ]
+
+    return [
+        bool(r_ok) and l_ok and validate_professor_data(professor)
+        for r_ok, l_ok, professor in zip(rating_ok, link_ok, professors)
+    ]
+
+@functools.lru_cache(maxsize=8192)
 def clean_professor_name(name: str) -> str:
     """
-    Clean and normalize professor name.
-    
+    Clean and normalize professor name. Results are memoized since the same
+    names recur heavily across re-scrapes.
+
     Args:
         name: Raw professor name
-        
+
     Returns:
         str: Cleaned professor name
     """
@@ -87,11 +220,14 @@ def clean_professor_name(name: str) -> str:
         return ""
     
     # Remove extra whitespace
-    name = re.sub(r'\s+', ' ', name.strip())
-    
+    name = _WS_RE.sub(' ', name.strip())
+
     # Remove any non-alphabetic characters except spaces, commas, periods, apostrophes, and hyphens
-    name = re.sub(r'[^A-Za-z\s,\.\'-]', '', name)
-    
+    if name.isascii():
+        name = name.translate(_NAME_DELETE_TBL)
+    else:
+        name = _NAME_STRIP_RE.sub('', name)
+
     return name
 
 def validate_rating(rating: Any) -> Optional[float]:
@@ -104,36 +240,47 @@ def validate_rating(rating: Any) -> Optional[float]:
     Returns:
         Optional[float]: Valid rating as float, or None if invalid
     """
-    try:
-        rating_float = float(rating)
-        if ScraperConfig.MIN_RATING <= rating_float <= ScraperConfig.MAX_RATING:
-            return round(rating_float, 2)
-        else:
-            print(f"Rating {rating_float} is outside valid range [{ScraperConfig.MIN_RATING}, {ScraperConfig.MAX_RATING}]")
+    # Fast path: ratings extracted browser-side already arrive as floats
+    if isinstance(rating, float):
+        rating_float = rating
+    else:
+        try:
+            rating_float = float(rating)
+        except (ValueError, TypeError):
+            log.debug("Invalid rating value: %s", rating)
             return None
-    except (ValueError, TypeError):
-        print(f"Invalid rating value: {rating}")
-        return None
 
+    if _MIN_RATING <= rating_float <= _MAX_RATING:
+        # Two-decimal rounding via integer scaling; cheaper than round()'s
+        # decimal-rounding path. Note this rounds half-up, so boundary
+        # values can land one hundredth above round()'s half-even result.
+        return int(rating_float * 100 + 0.5) / 100.0
+    log.debug("Rating %s is outside valid range [%s, %s]", rating_float, _MIN_RATING, _MAX_RATING)
+    return None
+
+@functools.lru_cache(maxsize=8192)
 def validate_professor_link(link: str) -> Optional[str]:
     """
-    Validate professor profile link.
-    
+    Validate professor profile link. Results are memoized on the URL string
+    since the same links recur across partial re-scrapes.
+
     Args:
         link: Professor profile URL
-        
+
     Returns:
         Optional[str]: Valid URL or None if invalid
     """
     if not link:
         return None
-    
-    # Check if it's a valid polyratings.dev professor URL
-    if re.match(r'^https://polyratings\.dev/professor/[a-f0-9-]+$', link):
-        return link
-    else:
-        print(f"Invalid professor link format: {link}")
-        return None
+
+    # Check if it's a valid polyratings.dev professor URL; the prefix and
+    # character-set scan match _LINK_RE without starting the regex engine
+    if link.startswith(_LINK_PREFIX):
+        tail = link[len(_LINK_PREFIX):]
+        if tail and all(c in _LINK_TAIL_CHARS for c in tail):
+            return link
+    log.debug("Invalid professor link format: %s", link)
+    return None
 
 def create_professor_entry(name: str, rating: Any, link: str) -> Optional[Dict[str, Any]]:
     """
@@ -149,58 +296,77 @@ def create_professor_entry(name: str, rating: Any, link: str) -> Optional[Dict[s
     """
     # Clean and validate name
     clean_name = clean_professor_name(name)
-    if not clean_name:
-        print(f"Invalid professor name: {name}")
+    if not clean_name or not (_MIN_NAME_LENGTH <= len(clean_name) <= _MAX_NAME_LENGTH):
+        log.debug("Invalid professor name: %s", name)
         return None
-    
+
     # Validate rating
     valid_rating = validate_rating(rating)
     if valid_rating is None:
         return None
-    
+
     # Validate link
     valid_link = validate_professor_link(link)
     if valid_link is None:
         return None
-    
+
     professor_entry = {
         "name": clean_name,
         "rating": valid_rating,
         "link": valid_link
     }
-    
-    # Final validation
-    if validate_professor_data(professor_entry):
-        return professor_entry
-    else:
-        return None
 
-def save_professors_json(professors: List[Dict[str, Any]], output_path: str) -> bool:
+    # The field checks above already enforce every schema constraint, so the
+    # final schema pass is redundant; keep it as a debug-only regression guard.
+    assert validate_professor_data(professor_entry)
+    return professor_entry
+
+def save_professors_json(professors: List[Dict[str, Any]], output_path: str, *, trusted: bool = False) -> bool:
     """
     Save professors data to JSON file with validation.
-    
+
     Args:
         professors: List of professor dictionaries
         output_path: Path to output JSON file
-        
+        trusted: Skip the pre-write validation pass; for callers whose
+            entries already came through create_professor_entry
+
     Returns:
         bool: True if successful, False otherwise
     """
-    try:
-        # Validate the entire list
+    # Validate the entire list, unless the caller already validated each
+    # entry upstream; then the walk is kept only as a debug-mode guard.
+    # This stays outside the try below so a guard failure surfaces as an
+    # AssertionError rather than being logged as an I/O error.
+    if not trusted:
         if not validate_professors_list(professors):
-            print("Validation failed for professors list")
+            log.debug("Validation failed for professors list")
             return False
-        
-        # Save to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(professors, f, indent=2, ensure_ascii=False)
-        
-        print(f"Successfully saved {len(professors)} professors to {output_path}")
+    elif __debug__ and not validate_professors_list(professors):
+        raise AssertionError("trusted professors failed validation")
+
+    try:
+        # Save to file; orjson encodes straight to UTF-8 bytes several times
+        # faster than stdlib json's pure-Python pretty-printer. Entries are
+        # encoded and written one at a time, so peak memory stays at one
+        # encoded entry instead of one giant output buffer.
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(b'[\n')
+                for i, professor in enumerate(professors):
+                    if i:
+                        f.write(b',\n')
+                    f.write(orjson.dumps(professor))
+                f.write(b'\n]')
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(professors, f, indent=2, ensure_ascii=False)
+
+        log.info("Successfully saved %d professors to %s", len(professors), output_path)
         return True
         
     except Exception as e:
-        print(f"Error saving professors data: {e}")
+        log.error("Error saving professors data: %s", e)
         return False
 
 def load_professors_json(input_path: str) -> Optional[List[Dict[str, Any]]]:
@@ -214,16 +380,24 @@ def load_professors_json(input_path: str) -> Optional[List[Dict[str, Any]]]:
         Optional[List[Dict[str, Any]]]: Valid professors list or None if invalid
     """
     try:
-        with open(input_path, 'r', encoding='utf-8') as f:
-            professors = json.load(f)
-        
-        if validate_professors_list(professors):
-            print(f"Successfully loaded {len(professors)} professors from {input_path}")
-            return professors
-        else:
-            print("Validation failed for loaded professors data")
+        # Parse and validate one professor at a time: each dict is checked
+        # while still hot in cache, the first invalid entry short-circuits,
+        # and the file is never materialized twice.
+        professors = []
+        with open(input_path, 'rb') as f:
+            for professor in ijson.items(f, 'item', use_float=True):
+                if not validate_professor_data(professor):
+                    log.debug("Validation failed for loaded professors data")
+                    return None
+                professors.append(professor)
+
+        if not professors:
+            log.debug("Validation failed for loaded professors data")
             return None
-            
+
+        log.info("Successfully loaded %d professors from %s", len(professors), input_path)
+        return professors
+
     except Exception as e:
-        print(f"Error loading professors data: {e}")
+        log.error("Error loading professors data: %s", e)
         return None 